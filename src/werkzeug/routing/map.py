@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import typing as t
 import warnings
-from pprint import pformat
+from collections import defaultdict
+from functools import cached_property
+from functools import lru_cache
+from string import ascii_letters
+from string import digits
 from threading import Lock
 from urllib.parse import quote
 from urllib.parse import urljoin
-from urllib.parse import urlunsplit
 
 from .._internal import _get_environ
 from .._internal import _wsgi_decoding_dance
@@ -26,7 +29,6 @@ from .exceptions import RequestPath
 from .exceptions import RequestRedirect
 from .exceptions import WebsocketMismatch
 from .matcher import StateMachineMatcher
-from .rules import _simple_rule_re
 from .rules import Rule
 
 if t.TYPE_CHECKING:
@@ -38,6 +40,32 @@ if t.TYPE_CHECKING:
     from .rules import RuleFactory
 
 
+# safe = https://url.spec.whatwg.org/#url-path-segment-string
+_path_safe = "!$&'()*+,/:;=@"
+_path_safe_chars = f"{ascii_letters}{digits}-._~{_path_safe}"
+_websocket_schemes = frozenset(("ws", "wss"))
+# The (HTTP, WebSocket) schemes to build URLs with for a given scheme.
+_insecure_build_schemes = ("http", "ws")
+_build_schemes = {"https": ("https", "wss"), "wss": ("https", "wss")}
+_standard_port_suffixes = {"http": ":80", "ws": ":80", "https": ":443", "wss": ":443"}
+
+
+def _quote_path(path: str) -> str:
+    # Redirect paths are usually already safe, stripping all safe characters
+    # checks that without encoding the path.
+    if not path.rstrip(_path_safe_chars):
+        return path
+
+    return quote(path, safe=_path_safe)
+
+
+@lru_cache(maxsize=256)
+def _idna_encode(server_name: str) -> str:
+    # The idna codec is implemented in Python and slow, but the server
+    # names seen by a map are usually few.
+    return server_name.encode("idna").decode("ascii")
+
+
 class Map:
     """The map class stores all the URL rules and some configuration
     parameters.  Some of the configuration values are only stored on the
@@ -66,6 +94,20 @@ class Map:
                           feature and disables the subdomain one.  If
                           enabled the `host` parameter to rules is used
                           instead of the `subdomain` one.
+    :param match_cache_size: Remember the results of this many distinct
+        matches, keyed by domain, path, method and websocket mode. Repeated
+        requests for the same URL then skip the matcher. Converters must
+        return the same value for the same URL part for this to be used.
+        Disabled by default.
+    :param build_cache_size: Remember the URLs built for this many distinct
+        calls to :meth:`MapAdapter.build`, keyed by the adapter's bound
+        values, the arguments, and the values with their types. Calls with
+        unhashable values are not cached. Converters must return the same
+        URL part for equal values for this to be used. Disabled by default.
+
+    .. versionchanged:: 3.1
+        The ``match_cache_size`` and ``build_cache_size`` parameters were
+        added.
 
     .. versionchanged:: 3.0
         The ``charset`` and ``encoding_errors`` parameters were removed.
@@ -102,16 +144,32 @@ class Map:
         sort_parameters: bool = False,
         sort_key: t.Callable[[t.Any], t.Any] | None = None,
         host_matching: bool = False,
+        match_cache_size: int = 0,
+        build_cache_size: int = 0,
     ) -> None:
         self._matcher = StateMachineMatcher(merge_slashes)
-        self._rules_by_endpoint: dict[str, list[Rule]] = {}
+        self._match_cache: t.Callable[..., tuple[Rule, t.Any]] | None = None
+        self._match: t.Callable[
+            [str, str, str, bool], tuple[Rule, t.MutableMapping[str, t.Any]]
+        ] = self._matcher.match
+        self._rules_by_endpoint: defaultdict[str, list[Rule]] = defaultdict(list)
+        self._single_rule_endpoints: dict[str, Rule] = {}
+        self._all_rules: list[Rule] = []
+        self._default_providers: dict[int, list[Rule]] = {}
+        self._build_rules_cache: dict[
+            tuple[str, str | None, frozenset[str]], list[Rule]
+        ] = {}
+        self._build_cache: dict[tuple[t.Any, ...], str] | None = None
         self._remap = True
+        self._remap_matcher = True
         self._remap_lock = self.lock_class()
 
         self.default_subdomain = default_subdomain
         self.strict_slashes = strict_slashes
         self.redirect_defaults = redirect_defaults
         self.host_matching = host_matching
+        self.match_cache_size = match_cache_size
+        self.build_cache_size = build_cache_size
 
         self.converters = self.default_converters.copy()
         if converters:
@@ -146,14 +204,22 @@ class Map:
         """
         self.update()
         arguments_set = set(arguments)
-        for rule in self._rules_by_endpoint[endpoint]:
+        for rule in self._get_endpoint_rules(endpoint):
             if arguments_set.issubset(rule.arguments):
                 return True
         return False
 
+    def _get_endpoint_rules(self, endpoint: str) -> list[Rule]:
+        # Don't add an empty entry for an unknown endpoint.
+        if endpoint not in self._rules_by_endpoint:
+            raise KeyError(endpoint)
+
+        return self._rules_by_endpoint[endpoint]
+
     @property
     def _rules(self) -> list[Rule]:
-        return [rule for rules in self._rules_by_endpoint.values() for rule in rules]
+        self.update()
+        return self._all_rules
 
     def iter_rules(self, endpoint: str | None = None) -> t.Iterator[Rule]:
         """Iterate over all rules or the rules of an endpoint.
@@ -164,8 +230,8 @@ class Map:
         """
         self.update()
         if endpoint is not None:
-            return iter(self._rules_by_endpoint[endpoint])
-        return iter(self._rules)
+            return iter(self._get_endpoint_rules(endpoint))
+        return iter(self._all_rules)
 
     def add(self, rulefactory: RuleFactory) -> None:
         """Add a new rule or factory to the map and bind it.  Requires that the
@@ -177,7 +243,8 @@ class Map:
             rule.bind(self)
             if not rule.build_only:
                 self._matcher.add(rule)
-            self._rules_by_endpoint.setdefault(rule.endpoint, []).append(rule)
+                self._remap_matcher = True
+            self._rules_by_endpoint[rule.endpoint].append(rule)
         self._remap = True
 
     def bind(
@@ -234,7 +301,7 @@ class Map:
         server_name, port_sep, port = server_name.partition(":")
 
         try:
-            server_name = server_name.encode("idna").decode("ascii")
+            server_name = _idna_encode(server_name)
         except UnicodeError as e:
             raise BadHost() from e
 
@@ -299,9 +366,11 @@ class Map:
         env = _get_environ(environ)
         wsgi_server_name = get_host(env).lower()
         scheme = env["wsgi.url_scheme"]
-        upgrade = any(
-            v.strip() == "upgrade"
-            for v in env.get("HTTP_CONNECTION", "").lower().split(",")
+        connection = env.get("HTTP_CONNECTION", "").lower()
+        # Most requests don't ask for an upgrade, only split the header if
+        # the token could be present.
+        upgrade = "upgrade" in connection and any(
+            v.strip() == "upgrade" for v in connection.split(",")
         )
 
         if upgrade and env.get("HTTP_UPGRADE", "").lower() == "websocket":
@@ -313,17 +382,21 @@ class Map:
             server_name = server_name.lower()
 
             # strip standard port to match get_host()
-            if scheme in {"http", "ws"} and server_name.endswith(":80"):
-                server_name = server_name[:-3]
-            elif scheme in {"https", "wss"} and server_name.endswith(":443"):
-                server_name = server_name[:-4]
+            port_suffix = _standard_port_suffixes.get(scheme)
 
-        if subdomain is None and not self.host_matching:
-            cur_server_name = wsgi_server_name.split(".")
-            real_server_name = server_name.split(".")
-            offset = -len(real_server_name)
+            if port_suffix is not None and server_name.endswith(port_suffix):
+                server_name = server_name[: -len(port_suffix)]
 
-            if cur_server_name[offset:] != real_server_name:
+        if subdomain is None and not self.host_matching:
+            if wsgi_server_name == server_name:
+                subdomain = ""
+            elif wsgi_server_name.endswith(f".{server_name}"):
+                subdomain = wsgi_server_name[: -len(server_name) - 1]
+
+                # drop empty labels from a malformed host
+                if subdomain[:1] == "." or subdomain[-1:] == "." or ".." in subdomain:
+                    subdomain = ".".join(filter(None, subdomain.split(".")))
+            else:
                 # This can happen even with valid configs if the server was
                 # accessed directly by IP address under some situations.
                 # Instead of raising an exception like in Werkzeug 0.7 or
@@ -335,8 +408,6 @@ class Map:
                     stacklevel=2,
                 )
                 subdomain = "<invalid>"
-            else:
-                subdomain = ".".join(filter(None, cur_server_name[:offset]))
 
         def _get_wsgi_string(name: str) -> str | None:
             val = env.get(name)
@@ -369,12 +440,117 @@ class Map:
             if not self._remap:
                 return
 
-            self._matcher.update()
+            # Build only rules are not part of the matcher, adding them
+            # only requires sorting the rules for building.
+            if self._remap_matcher:
+                self._update_matcher()
+                self._remap_matcher = False
+
             for rules in self._rules_by_endpoint.values():
                 rules.sort(key=lambda x: x.build_compare_key())
+
+            # For redirect_defaults, find the rules that provide defaults
+            # for each rule, keyed by rule id as rules are not hashable.
+            # Every rule that comes after a rule, including itself, has a
+            # lower priority for the defaults. Most rules have none and
+            # can skip looking for them when matching. The dicts are only
+            # assigned once complete, as readers don't wait for the lock.
+            default_providers: dict[int, list[Rule]] = {}
+
+            for rules in self._rules_by_endpoint.values():
+                candidates: list[Rule] = []
+
+                for rule in rules:
+                    providers = [r for r in candidates if r.provides_defaults_for(rule)]
+
+                    if providers:
+                        default_providers[id(rule)] = providers
+
+                    if rule.defaults and not rule.build_only:
+                        candidates.append(rule)
+
+            self._default_providers = default_providers
+            self._single_rule_endpoints = {
+                endpoint: rules[0]
+                for endpoint, rules in self._rules_by_endpoint.items()
+                if len(rules) == 1
+            }
+
+            # A new list so that iterating over the previous one while
+            # adding rules is not affected.
+            self._all_rules = [
+                rule for rules in self._rules_by_endpoint.values() for rule in rules
+            ]
+            self._build_rules_cache = {}
+            self._build_cache = {} if self.build_cache_size else None
             self._remap = False
 
+    def _get_build_rules(
+        self, endpoint: str, method: str | None, values: t.Mapping[str, t.Any]
+    ) -> list[Rule]:
+        """The rules of an endpoint that could be suitable for building
+        with the given method and value names. Which rules have the
+        required arguments only depends on the names, so it is cached,
+        but values still have to be checked against defaults.
+
+        :internal:
+        """
+        # Keep using the same cache if update replaces it meanwhile, so
+        # rules from before the update aren't stored in the new one.
+        cache = self._build_rules_cache
+        key = (endpoint, method, frozenset(values))
+        rules = cache.get(key)
+
+        if rules is None:
+            rules = []
+
+            for rule in self._rules_by_endpoint.get(endpoint, ()):
+                if (
+                    method is not None
+                    and rule.methods is not None
+                    and method not in rule.methods
+                ):
+                    continue
+
+                defaults = rule.defaults or ()
+
+                if all(k in defaults or k in values for k in rule.arguments):
+                    rules.append(rule)
+
+            # Keep the cache bounded if the names keep changing.
+            if len(cache) >= 1024:
+                cache.clear()
+
+            cache[key] = rules
+
+        return rules
+
+    def _update_matcher(self) -> None:
+        self._matcher.update()
+
+        # Pick the match function once so matching doesn't have to
+        # check for the cache. A new cache discards results for the
+        # previous set of rules.
+        if self.match_cache_size:
+            self._match_cache = match_cache = lru_cache(maxsize=self.match_cache_size)(
+                self._matcher.match
+            )
+
+            def _match(
+                domain: str, path: str, method: str, websocket: bool
+            ) -> tuple[Rule, t.MutableMapping[str, t.Any]]:
+                rule, rv = match_cache(domain, path, method, websocket)
+                # The cached values are shared, don't let them be modified.
+                return rule, dict(rv)
+
+            self._match = _match
+        else:
+            self._match_cache = None
+            self._match = self._matcher.match
+
     def __repr__(self) -> str:
+        from pprint import pformat
+
         rules = self.iter_rules()
         return f"{type(self).__name__}({pformat(list(rules))})"
 
@@ -407,7 +583,14 @@ class MapAdapter:
         self.path_info = path_info
         self.default_method = default_method
         self.query_args = query_args
-        self.websocket = self.url_scheme in {"ws", "wss"}
+        self.websocket = url_scheme in _websocket_schemes
+
+        # The host for the bound subdomain, or the server name if host
+        # matching is enabled, used for redirects and external URLs.
+        if subdomain and not map.host_matching:
+            self._default_host = f"{subdomain}.{server_name}"
+        else:
+            self._default_host = server_name
 
     def dispatch(
         self,
@@ -584,7 +767,12 @@ class MapAdapter:
         .. versionadded:: 0.6
             Added ``return_rule``.
         """
-        self.map.update()
+        map = self.map
+
+        # Only call update if rules were added since the last one.
+        if map._remap:
+            map.update()
+
         if path_info is None:
             path_info = self.path_info
         if query_args is None:
@@ -596,18 +784,20 @@ class MapAdapter:
 
         domain_part = self.server_name
 
-        if not self.map.host_matching and self.subdomain is not None:
+        if not map.host_matching and self.subdomain is not None:
             domain_part = self.subdomain
 
-        path_part = f"/{path_info.lstrip('/')}" if path_info else ""
+        # Most paths already start with a single slash, use them as is.
+        if path_info[:1] == "/" and path_info[1:2] != "/":
+            path_part = path_info
+        else:
+            path_part = f"/{path_info.lstrip('/')}" if path_info else ""
 
         try:
-            result = self.map._matcher.match(domain_part, path_part, method, websocket)
+            result = map._match(domain_part, path_part, method, websocket)
         except RequestPath as e:
-            # safe = https://url.spec.whatwg.org/#url-path-segment-string
-            new_path = quote(e.path_info, safe="!$&'()*+,/:;=@")
             raise RequestRedirect(
-                self.make_redirect_url(new_path, query_args)
+                self.make_redirect_url(_quote_path(e.path_info), query_args)
             ) from None
         except RequestAliasRedirect as e:
             raise RequestRedirect(
@@ -630,30 +820,29 @@ class MapAdapter:
         else:
             rule, rv = result
 
-            if self.map.redirect_defaults:
+            if map.redirect_defaults and id(rule) in map._default_providers:
                 redirect_url = self.get_default_redirect(rule, method, rv, query_args)
                 if redirect_url is not None:
                     raise RequestRedirect(redirect_url)
 
-            if rule.redirect_to is not None:
-                if isinstance(rule.redirect_to, str):
+            redirect_to = rule.redirect_to
 
-                    def _handle_match(match: t.Match[str]) -> str:
-                        value = rv[match.group(1)]
-                        return rule._converters[match.group(1)].to_url(value)
+            if redirect_to is not None:
+                if isinstance(redirect_to, str):
+                    parts = rule._redirect_to_parts.copy()
 
-                    redirect_url = _simple_rule_re.sub(_handle_match, rule.redirect_to)
-                else:
-                    redirect_url = rule.redirect_to(self, **rv)
+                    for i in range(1, len(parts), 2):
+                        name = parts[i]
+                        parts[i] = rule._converters[name].to_url(rv[name])
 
-                if self.subdomain:
-                    netloc = f"{self.subdomain}.{self.server_name}"
+                    redirect_url = "".join(parts)
                 else:
-                    netloc = self.server_name
+                    redirect_url = redirect_to(self, **rv)
 
                 raise RequestRedirect(
                     urljoin(
-                        f"{self.url_scheme or 'http'}://{netloc}{self.script_name}",
+                        f"{self.url_scheme or 'http'}://{self._default_host}"
+                        f"{self.script_name}",
                         redirect_url,
                     )
                 )
@@ -698,19 +887,14 @@ class MapAdapter:
         domain part is a subdomain in case host matching is disabled or
         a full host name.
         """
-        if self.map.host_matching:
-            if domain_part is None:
-                return self.server_name
+        if domain_part is None:
+            return self._default_host
 
+        if self.map.host_matching:
             return domain_part
 
-        if domain_part is None:
-            subdomain = self.subdomain
-        else:
-            subdomain = domain_part
-
-        if subdomain:
-            return f"{subdomain}.{self.server_name}"
+        if domain_part:
+            return f"{domain_part}.{self.server_name}"
         else:
             return self.server_name
 
@@ -726,14 +910,11 @@ class MapAdapter:
 
         :internal:
         """
-        assert self.map.redirect_defaults
-        for r in self.map._rules_by_endpoint[rule.endpoint]:
-            # every rule that comes after this one, including ourself
-            # has a lower priority for the defaults.  We order the ones
-            # with the highest priority up for building.
-            if r is rule:
-                break
-            if r.provides_defaults_for(rule) and r.suitable_for(values, method):
+        map = self.map
+        assert map.redirect_defaults
+        # The rules are ordered with the highest priority first.
+        for r in map._default_providers.get(id(rule), ()):
+            if r.suitable_for(values, method):
                 values.update(r.defaults)  # type: ignore
                 domain_part, path = r.build(values)  # type: ignore
                 return self.make_redirect_url(path, query_args, domain_part=domain_part)
@@ -744,6 +925,17 @@ class MapAdapter:
             return _urlencode(query_args)
         return query_args
 
+    @cached_property
+    def _redirect_prefix(self) -> str:
+        # The script name with exactly one slash on each side, computed on
+        # the first redirect rather than for every bound adapter.
+        script_name = self.script_name.strip("/")
+
+        if script_name:
+            return f"/{script_name}/"
+
+        return "/"
+
     def make_redirect_url(
         self,
         path_info: str,
@@ -757,15 +949,21 @@ class MapAdapter:
         if query_args is None:
             query_args = self.query_args
 
-        if query_args:
-            query_str = self.encode_query_args(query_args)
-        else:
+        if not query_args:
             query_str = None
+        elif isinstance(query_args, str):
+            query_str = query_args
+        else:
+            query_str = _urlencode(query_args)
 
         scheme = self.url_scheme or "http"
         host = self.get_host(domain_part)
-        path = "/".join((self.script_name.strip("/"), path_info.lstrip("/")))
-        return urlunsplit((scheme, host, path, query_str, None))
+        url = f"{scheme}://{host}{self._redirect_prefix}{path_info.lstrip('/')}"
+
+        if query_str:
+            return f"{url}?{query_str}"
+
+        return url
 
     def make_alias_redirect_url(
         self,
@@ -784,6 +982,22 @@ class MapAdapter:
         assert url != path, "detected invalid alias setting. No canonical URL found"
         return url
 
+    @cached_property
+    def _build_prefix(self) -> str:
+        # The script name with a single trailing slash for internal URLs.
+        return f"{self.script_name.rstrip('/')}/"
+
+    @cached_property
+    def _build_cache_key(self) -> tuple[t.Any, ...]:
+        # The bound values that built URLs depend on.
+        return (
+            self.server_name,
+            self.subdomain,
+            self.script_name,
+            self.url_scheme,
+            self.default_method,
+        )
+
     def _partial_build(
         self,
         endpoint: str,
@@ -796,32 +1010,101 @@ class MapAdapter:
 
         :internal:
         """
-        # in case the method is none, try with the default method first
+        map = self.map
+        rule = map._single_rule_endpoints.get(endpoint)
+
+        # If the endpoint has a single rule, it is the only one to check.
+        # Trying the default method first would give the same result.
+        if rule is not None:
+            if rule.suitable_for(values, method):
+                build_rv = rule.build(values, append_unknown)
+
+                if build_rv is not None:
+                    return (*build_rv, rule.websocket)
+
+            return None
+
+        # in case the method is none, try with the default method first,
+        # then with any method
         if method is None:
-            rv = self._partial_build(
-                endpoint, values, self.default_method, append_unknown
-            )
+            methods: tuple[str | None, ...] = (self.default_method, None)
+        else:
+            methods = (method,)
+
+        # The host matching setting doesn't change, pick the loop once.
+        if map.host_matching:
+            build_rules = self._partial_build_host
+        else:
+            build_rules = self._partial_build_simple
+
+        for method in methods:
+            # Skip rules that can't be suitable. The rules allow the method,
+            # only the values need to be checked.
+            rules = map._get_build_rules(endpoint, method, values)
+            rv = build_rules(rules, values, append_unknown)
+
             if rv is not None:
                 return rv
 
-        # Default method did not match or a specific method is passed.
-        # Check all for first match with matching host. If no matching
-        # host is found, go with first result.
-        first_match = None
+        return None
 
-        for rule in self.map._rules_by_endpoint.get(endpoint, ()):
-            if rule.suitable_for(values, method):
+    def _partial_build_simple(
+        self,
+        rules: t.Iterable[Rule],
+        values: t.Mapping[str, t.Any],
+        append_unknown: bool,
+    ) -> tuple[str, str, bool] | None:
+        """Helper for :meth:`_partial_build` without host matching. Goes
+        with the first rule that builds.
+
+        :internal:
+        """
+        for rule in rules:
+            if rule.suitable_for(values):
                 build_rv = rule.build(values, append_unknown)
 
                 if build_rv is not None:
-                    rv = (build_rv[0], build_rv[1], rule.websocket)
-                    if self.map.host_matching:
-                        if rv[0] == self.server_name:
-                            return rv
-                        elif first_match is None:
-                            first_match = rv
-                    else:
-                        return rv
+                    return (*build_rv, rule.websocket)
+
+        return None
+
+    def _partial_build_host(
+        self,
+        rules: t.Iterable[Rule],
+        values: t.Mapping[str, t.Any],
+        append_unknown: bool,
+    ) -> tuple[str, str, bool] | None:
+        """Helper for :meth:`_partial_build` with host matching. Goes with
+        the first rule that builds for the bound host, or the first rule
+        that builds if none match the host.
+
+        :internal:
+        """
+        server_name = self.server_name
+        rules_iter = iter(rules)
+
+        for rule in rules_iter:
+            if rule.suitable_for(values):
+                build_rv = rule.build(values, append_unknown)
+
+                if build_rv is not None:
+                    first_match = (*build_rv, rule.websocket)
+
+                    if build_rv[0] == server_name:
+                        return first_match
+
+                    break
+        else:
+            return None
+
+        # The first result is known, continue with the remaining rules
+        # only looking for a matching host.
+        for rule in rules_iter:
+            if rule.suitable_for(values):
+                build_rv = rule.build(values, append_unknown)
+
+                if build_rv is not None and build_rv[0] == server_name:
+                    return (*build_rv, rule.websocket)
 
         return first_match
 
@@ -905,47 +1188,125 @@ class MapAdapter:
         .. versionadded:: 0.6
            Added the ``append_unknown`` parameter.
         """
-        self.map.update()
+        map = self.map
+
+        # Only call update if rules were added since the last one.
+        if map._remap:
+            map.update()
 
         if values:
-            if isinstance(values, MultiDict):
-                values = {
-                    k: (v[0] if len(v) == 1 else v)
-                    for k, v in dict.items(values)
-                    if len(v) != 0
-                }
-            else:  # plain dict
+            # Most values are a dict or a MultiDict, check their type
+            # before looking for MultiDict subclasses.
+            values_type = type(values)
+
+            if values_type is MultiDict or (
+                values_type is not dict and isinstance(values, MultiDict)
+            ):
+                flat: dict[str, t.Any] = {}
+
+                multi_values = t.cast("MultiDict[str, t.Any]", values)
+
+                for name, value_list in dict.items(multi_values):
+                    n = len(value_list)
+
+                    if n == 1:
+                        flat[name] = value_list[0]
+                    elif n:
+                        flat[name] = value_list
+
+                values = flat
+            # A plain dict without None values can be used as is.
+            elif values_type is not dict or any(v is None for v in values.values()):
                 values = {k: v for k, v in values.items() if v is not None}
         else:
             values = {}
 
+        cache = map._build_cache
+
+        if cache is None:
+            return self._build_url(
+                endpoint, values, method, force_external, append_unknown, url_scheme
+            )
+
+        key = (
+            self._build_cache_key,
+            endpoint,
+            method,
+            force_external,
+            append_unknown,
+            url_scheme,
+            tuple([(k, type(v), v) for k, v in values.items()]),
+        )
+
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable values can't be cached.
+            return self._build_url(
+                endpoint, values, method, force_external, append_unknown, url_scheme
+            )
+
+        url = self._build_url(
+            endpoint, values, method, force_external, append_unknown, url_scheme
+        )
+
+        # Keep the cache bounded if the values keep changing.
+        if len(cache) >= map.build_cache_size:
+            cache.clear()
+
+        cache[key] = url
+        return url
+
+    def _build_url(
+        self,
+        endpoint: str,
+        values: t.Mapping[str, t.Any],
+        method: str | None,
+        force_external: bool,
+        append_unknown: bool,
+        url_scheme: str | None,
+    ) -> str:
+        """Helper for :meth:`build`. Builds the URL from the normalized
+        values.
+
+        :internal:
+        """
         rv = self._partial_build(endpoint, values, method, append_unknown)
         if rv is None:
             raise BuildError(endpoint, values, method, self)
 
         domain_part, path, websocket = rv
-        host = self.get_host(domain_part)
+
+        # Built paths start with a single slash unless a value added more,
+        # only scan for leading slashes in that case.
+        if path[:1] == "/" and path[1:2] != "/":
+            path = path[1:]
+        else:
+            path = path.lstrip("/")
+
+        # shortcut this. Always build WebSocket routes with the scheme
+        # (browsers require full URLs).
+        if (
+            not force_external
+            and not websocket
+            and domain_part
+            == (self.server_name if self.map.host_matching else self.subdomain)
+        ):
+            return f"{self._build_prefix}{path}"
 
         if url_scheme is None:
             url_scheme = self.url_scheme
 
-        # Always build WebSocket routes with the scheme (browsers
-        # require full URLs). If bound to a WebSocket, ensure that HTTP
-        # routes are built with an HTTP scheme.
-        secure = url_scheme in {"https", "wss"}
-
-        if websocket:
-            force_external = True
-            url_scheme = "wss" if secure else "ws"
-        elif url_scheme:
-            url_scheme = "https" if secure else "http"
-
-        # shortcut this.
-        if not force_external and (
-            (self.map.host_matching and host == self.server_name)
-            or (not self.map.host_matching and domain_part == self.subdomain)
-        ):
-            return f"{self.script_name.rstrip('/')}/{path.lstrip('/')}"
+        # If bound to a WebSocket, ensure that HTTP routes are built
+        # with an HTTP scheme.
+        if websocket or url_scheme:
+            url_scheme = _build_schemes.get(url_scheme, _insecure_build_schemes)[
+                websocket
+            ]
 
+        # script_name always ends with a slash, see __init__.
         scheme = f"{url_scheme}:" if url_scheme else ""
-        return f"{scheme}//{host}{self.script_name[:-1]}/{path.lstrip('/')}"
+        host = self.get_host(domain_part)
+        return f"{scheme}//{host}{self.script_name}{path}"
@@ -33,9 +33,16 @@ class State:
 class StateMachineMatcher:
     def __init__(self, merge_slashes: bool) -> None:
         self._root = State()
+        self._static_rules: dict[tuple[str, str], list[Rule]] = {}
         self.merge_slashes = merge_slashes
 
     def add(self, rule: Rule) -> None:
+        if all(part.static for part in rule._parts):
+            # Rules without any converters can be looked up directly by
+            # their domain and path, skipping the state machine walk.
+            domain, *parts = (part.content for part in rule._parts)
+            self._static_rules.setdefault((domain, "/".join(parts)), []).append(rule)
+
         state = self._root
         for part in rule._parts:
             if part.static:
@@ -69,6 +76,24 @@ class StateMachineMatcher:
     def match(
         self, domain: str, path: str, method: str, websocket: bool
     ) -> tuple[Rule, t.MutableMapping[str, t.Any]]:
+        # Static rules are found with a single lookup. They would be the
+        # first match of the state machine as static transitions are
+        # tried first, if none accept the method and websocket mode fall
+        # back to the state machine to collect the error information.
+        static_rules = self._static_rules.get((domain, path))
+
+        if static_rules is not None:
+            for rule in static_rules:
+                if (
+                    rule.methods is None or method in rule.methods
+                ) and rule.websocket == websocket:
+                    result = dict(rule.defaults) if rule.defaults else {}
+
+                    if rule.alias and rule.map.redirect_defaults:
+                        raise RequestAliasRedirect(result, rule.endpoint)
+
+                    return rule, result
+
         # To match to a rule we need to start at the root state and
         # try to follow the transitions until we find a match, or find
         # there is no transition to follow.
@@ -127,7 +152,7 @@ class StateMachineMatcher:
                 if test_part.final:
                     target = "/".join(parts)
                     remaining = []
-                match = re.compile(test_part.content).match(target)
+                match = test_part._regex.match(target)
                 if match is not None:
                     if test_part.suffixed:
                         # If a part_isolating=False part has a slash suffix, remove the
@@ -136,14 +161,7 @@ class StateMachineMatcher:
                         if suffix == "/":
                             remaining = [""]
 
-                    converter_groups = sorted(
-                        match.groupdict().items(), key=lambda entry: entry[0]
-                    )
-                    groups = [
-                        value
-                        for key, value in converter_groups
-                        if key[:11] == "__werkzeug_"
-                    ]
+                    groups = [match[name] for name in test_part._converter_groups]
                     rv = _match(new_state, remaining, values + groups)
                     if rv is not None:
                         return rv
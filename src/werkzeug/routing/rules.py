@@ -4,6 +4,7 @@ import ast
 import re
 import typing as t
 from dataclasses import dataclass
+from functools import cached_property
 from string import Template
 from types import CodeType
 from urllib.parse import quote
@@ -41,6 +42,18 @@ class RulePart:
     suffixed: bool
     weight: Weighting
 
+    @cached_property
+    def _regex(self) -> t.Pattern[str]:
+        return re.compile(self.content)
+
+    @cached_property
+    def _converter_groups(self) -> list[str]:
+        # The converter values are captured by groups named
+        # ``__werkzeug_{n}``, other groups come from converter regexes.
+        return sorted(
+            name for name in self._regex.groupindex if name[:11] == "__werkzeug_"
+        )
+
 
 _part_re = re.compile(
     r"""
@@ -504,6 +517,7 @@ class Rule(RuleFactory):
         self._converters: dict[str, BaseConverter] = {}
         self._trace: list[tuple[bool, str]] = []
         self._parts: list[RulePart] = []
+        self._redirect_to_parts: list[str] = []
 
     def empty(self) -> Rule:
         """
@@ -715,6 +729,10 @@ class Rule(RuleFactory):
             rule = re.sub("/{2,}?", "/", self.rule)
         self._parts.extend(self._parse_rule(rule))
 
+        if isinstance(self.redirect_to, str):
+            # Alternating static text and names of values to substitute.
+            self._redirect_to_parts = _simple_rule_re.split(self.redirect_to)
+
         self._build: t.Callable[..., tuple[str, str]]
         self._build = self._compile_builder(False).__get__(self, None)
         self._build_unknown: t.Callable[..., tuple[str, str]]
@@ -1,3 +1,4 @@
+import enum
 import gc
 import typing as t
 import uuid
@@ -246,6 +247,71 @@ def test_strict_slashes_leaves_dont_consume():
     assert adapter.match("/path5/", method="GET") == ("leaf", {})
 
 
+def test_static_rule_falls_back_to_dynamic():
+    map = r.Map(
+        [
+            r.Rule("/foo", endpoint="static", methods=["POST"]),
+            r.Rule("/<name>", endpoint="dynamic", methods=["GET"]),
+        ]
+    )
+    adapter = map.bind("localhost")
+    assert adapter.match("/foo", "POST") == ("static", {})
+    assert adapter.match("/foo", "GET") == ("dynamic", {"name": "foo"})
+
+    with pytest.raises(MethodNotAllowed) as excinfo:
+        adapter.match("/foo", "PUT")
+
+    assert sorted(excinfo.value.valid_methods) == ["GET", "HEAD", "POST"]
+
+
+def test_match_cache():
+    map = r.Map(
+        [r.Rule("/", endpoint="index"), r.Rule("/<int:id>", endpoint="show")],
+        match_cache_size=10,
+    )
+    adapter = map.bind("localhost")
+    assert adapter.match("/42") == ("show", {"id": 42})
+    rv = adapter.match("/42")[1]
+    rv["id"] = 0
+    assert adapter.match("/42") == ("show", {"id": 42})
+    assert map._match_cache.cache_info().hits == 2
+
+    with pytest.raises(NotFound):
+        adapter.match("/foo")
+
+    map.add(r.Rule("/foo", endpoint="foo"))
+    assert adapter.match("/foo") == ("foo", {})
+    assert adapter.match("/42") == ("show", {"id": 42})
+    assert map._match_cache.cache_info().hits == 0
+
+    # build only rules don't discard the cache
+    map.add(r.Rule("/bar", endpoint="bar", build_only=True))
+    assert adapter.match("/42") == ("show", {"id": 42})
+    assert map._match_cache.cache_info().hits == 1
+    assert adapter.build("bar") == "/bar"
+
+
+def test_build_cache():
+    map = r.Map([r.Rule("/<id>", endpoint="show")], build_cache_size=2)
+    adapter = map.bind("localhost")
+    assert adapter.build("show", {"id": 1}) == "/1"
+    assert adapter.build("show", {"id": True}) == "/True"
+    assert adapter.build("show", {"id": 1}, force_external=True) == (
+        "http://localhost/1"
+    )
+    assert map.bind("example.org").build("show", {"id": 1}, force_external=True) == (
+        "http://example.org/1"
+    )
+    assert len(map._build_cache) == 2
+    # unhashable values are not cached
+    assert adapter.build("show", {"id": 1, "tag": ["a", "b"]}) == "/1?tag=a&tag=b"
+    assert len(map._build_cache) == 2
+
+    map.add(r.Rule("/item/<id>", endpoint="show"))
+    assert adapter.build("show", {"id": 1}) == "/1"
+    assert len(map._build_cache) == 1
+
+
 def test_environ_defaults():
     environ = create_environ("/foo")
     assert environ["PATH_INFO"] == "/foo"
@@ -970,6 +1036,40 @@ def test_build_drop_none():
     assert "flop" not in url
 
 
+def test_build_same_names_different_rules():
+    map = r.Map(
+        [
+            r.Rule("/", endpoint="page", defaults={"page": 1}),
+            r.Rule("/page/<int:page>", endpoint="page"),
+            r.Rule("/page/<int:page>/<sort>", endpoint="page"),
+        ]
+    )
+    adapter = map.bind("localhost")
+    assert adapter.build("page", {"page": 1}) == "/"
+    assert adapter.build("page", {"page": 2}) == "/page/2"
+    assert adapter.build("page", {"page": 1}) == "/"
+    assert adapter.build("page", {"page": 1, "sort": "asc"}) == "/page/1/asc"
+    assert adapter.build("page", {}) == "/"
+
+
+def test_build_method_rules():
+    map = r.Map(
+        [
+            r.Rule("/items", endpoint="items", methods=["GET"]),
+            r.Rule("/items/new", endpoint="items", methods=["POST"]),
+            r.Rule("/items/any", endpoint="items"),
+        ]
+    )
+    adapter = map.bind("localhost")
+    assert adapter.build("items", method="GET") == "/items"
+    assert adapter.build("items", method="POST") == "/items/new"
+    assert adapter.build("items", method="PUT") == "/items/any"
+    assert adapter.build("items") == "/items"
+
+    with pytest.raises(r.BuildError):
+        adapter.build("missing", method="GET")
+
+
 def test_method_fallback():
     map = r.Map(
         [
@@ -1021,6 +1121,7 @@ def test_allowed_methods_querying():
     )
     a = m.bind("example.org")
     assert sorted(a.allowed_methods("/foo")) == ["GET", "HEAD", "POST"]
+    assert isinstance(a.allowed_methods("/foo"), list)
 
 
 def test_external_building_with_port():
@@ -1204,6 +1305,32 @@ def test_server_name_casing():
         a.match()
 
 
+def test_rule_redirect_to():
+    map = r.Map(
+        [
+            r.Rule("/old/<int:id>/<name>", redirect_to="new/<id>/<name>.html"),
+            r.Rule("/static", redirect_to="/new"),
+            r.Rule("/func/<name>", redirect_to=lambda a, name: f"/new/{name.upper()}"),
+        ]
+    )
+    adapter = map.bind("example.org", "/app")
+
+    with pytest.raises(r.RequestRedirect) as excinfo:
+        adapter.match("/old/42/a b")
+
+    assert excinfo.value.new_url == "http://example.org/app/new/42/a%20b.html"
+
+    with pytest.raises(r.RequestRedirect) as excinfo:
+        adapter.match("/static")
+
+    assert excinfo.value.new_url == "http://example.org/new"
+
+    with pytest.raises(r.RequestRedirect) as excinfo:
+        adapter.match("/func/foo")
+
+    assert excinfo.value.new_url == "http://example.org/new/FOO"
+
+
 def test_redirect_request_exception_code():
     exc = r.RequestRedirect("http://www.google.com/")
     exc.code = 307
@@ -1277,6 +1404,18 @@ def test_both_bind_and_match_path_info_are_none():
     assert ma.match() == ("index", {})
 
 
+def test_unknown_endpoint_rules():
+    m = r.Map([r.Rule("/", endpoint="index")])
+
+    with pytest.raises(KeyError):
+        m.iter_rules("missing")
+
+    with pytest.raises(KeyError):
+        m.is_endpoint_expecting("missing", "id")
+
+    assert "missing" not in m._rules_by_endpoint
+
+
 def test_map_repr():
     m = r.Map([r.Rule("/wat", endpoint="enter"), r.Rule("/woop", endpoint="foobar")])
     rv = repr(m)
@@ -1433,6 +1572,20 @@ def test_build_url_same_endpoint_multiple_hosts():
     beta_case = m.bind("BeTa.ExAmPlE.CoM")
     assert beta_case.build("index") == "/"
 
+    other = m.bind("other.example.com")
+    assert other.build("index") == "http://alpha.example.com/"
+
+
+def test_build_str_subclass_subdomain():
+    class Subdomain(str, enum.Enum):
+        API = "api"
+
+    m = r.Map([r.Rule("/", endpoint="index")], default_subdomain=Subdomain.API)
+    adapter = m.bind("example.com")
+    assert adapter.build("index") == "/"
+    adapter = m.bind("example.com", subdomain=Subdomain.API)
+    assert adapter.build("index") == "/"
+
 
 def test_rule_websocket_methods():
     with pytest.raises(ValueError):